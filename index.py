@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import List, Optional
+import sys
 import time
+import heapq
 from collections import deque
 
-@dataclass
+@dataclass(slots=True)
 class Process:
     pid: int                    # Process ID
     arrival_time: int           # When the process arrives
@@ -18,218 +20,361 @@ class Process:
             self.remaining_time = self.burst_time
 
 class CPUScheduler:
-    def __init__(self, processes: List[Process]):
-        # Make a copy so we don't modify the original
-        self.processes = [Process(
-            pid=p.pid,
-            arrival_time=p.arrival_time,
-            burst_time=p.burst_time,
-            priority=p.priority,
-            remaining_time=p.burst_time
-        ) for p in processes]
+    def __init__(self, processes: List[Process], copy: bool = True):
+        if copy:
+            # Make a copy so we don't modify the original
+            self.processes = [Process(
+                pid=p.pid,
+                arrival_time=p.arrival_time,
+                burst_time=p.burst_time,
+                priority=p.priority,
+                remaining_time=p.burst_time
+            ) for p in processes]
+        else:
+            # Caller hands over fresh processes, just reset their run state
+            self.processes = list(processes)
+            for p in self.processes:
+                p.remaining_time = p.burst_time
+                p.start_time = None
+                p.completion_time = None
         self.gantt_chart = []
         self.current_time = 0
+        # (cache key, metrics) from the last get_metrics call
+        self._metrics = None
+
+    def _emit(self, pid: int, start: int, end: int):
+        """Append a Gantt segment, extending the last one if it is the same process"""
+        gantt_chart = self.gantt_chart
+        if gantt_chart:
+            last_pid, last_start, last_end = gantt_chart[-1]
+            if last_pid == pid and last_end == start:
+                gantt_chart[-1] = (pid, last_start, end)
+                return
+        gantt_chart.append((pid, start, end))
 
     def fcfs(self):
         """First Come First Serve - The simplest scheduling algorithm"""
         # Sort by arrival time
         self.processes.sort(key=lambda p: p.arrival_time)
         
+        emit = self._emit
+        now = self.current_time
+        
         for process in self.processes:
             # If we need to wait for the process to arrive, update current time
-            if self.current_time < process.arrival_time:
-                self.current_time = process.arrival_time
+            if now < process.arrival_time:
+                now = process.arrival_time
             
-            process.start_time = self.current_time
+            process.start_time = now
             # Add to Gantt chart - (pid, start_time, end_time)
-            self.gantt_chart.append((process.pid, self.current_time, 
-                                   self.current_time + process.burst_time))
+            emit(process.pid, now, now + process.burst_time)
             
-            self.current_time += process.burst_time
-            process.completion_time = self.current_time
+            now += process.burst_time
+            process.completion_time = now
+        
+        self.current_time = now
 
     def sjf(self):
         """Shortest Job First - Non-preemptive scheduling by shortest burst time"""
+        # Min-heap of (burst_time, seq, process); seq breaks ties by arrival order
         ready_queue = []
-        remaining_processes = self.processes.copy()
+        arrivals = sorted(self.processes, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        i = 0
+        seq = 0
+        # Bind hot lookups to locals so the loop avoids attribute dispatch
+        push, pop = heapq.heappush, heapq.heappop
+        emit = self._emit
+        now = self.current_time
         
-        while remaining_processes or ready_queue:
+        while i < n or ready_queue:
             # Add all processes that have arrived to ready queue
-            while remaining_processes and remaining_processes[0].arrival_time <= self.current_time:
-                ready_queue.append(remaining_processes.pop(0))
+            while i < n and arrivals[i].arrival_time <= now:
+                p = arrivals[i]
+                push(ready_queue, (p.burst_time, seq, p))
+                seq += 1
+                i += 1
             
             if not ready_queue:
                 # Jump to next process arrival if nothing is ready
-                self.current_time = remaining_processes[0].arrival_time
+                now = arrivals[i].arrival_time
                 continue
                 
-            # Sort ready queue by burst time
-            ready_queue.sort(key=lambda p: p.burst_time)
-            process = ready_queue.pop(0)
+            # Pick the process with the shortest burst time
+            burst, _, process = pop(ready_queue)
             
-            process.start_time = self.current_time
-            self.gantt_chart.append((process.pid, self.current_time, 
-                                   self.current_time + process.burst_time))
+            process.start_time = now
+            emit(process.pid, now, now + burst)
             
-            self.current_time += process.burst_time
-            process.completion_time = self.current_time
+            now += burst
+            process.completion_time = now
+        
+        self.current_time = now
 
     def priority_scheduling(self):
         """Non-preemptive Priority Scheduling"""
+        # Min-heap of (priority, seq, process); seq breaks ties by arrival order
         ready_queue = []
-        remaining_processes = sorted(self.processes, key=lambda p: p.arrival_time)
+        arrivals = sorted(self.processes, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        i = 0
+        seq = 0
+        push, pop = heapq.heappush, heapq.heappop
+        emit = self._emit
+        now = self.current_time
         
-        while remaining_processes or ready_queue:
+        while i < n or ready_queue:
             # Add arrived processes to ready queue
-            while remaining_processes and remaining_processes[0].arrival_time <= self.current_time:
-                ready_queue.append(remaining_processes.pop(0))
+            while i < n and arrivals[i].arrival_time <= now:
+                p = arrivals[i]
+                push(ready_queue, (p.priority, seq, p))
+                seq += 1
+                i += 1
             
             if not ready_queue:
-                self.current_time = remaining_processes[0].arrival_time
+                now = arrivals[i].arrival_time
                 continue
                 
-            # Sort by priority (lower number = higher priority)
-            ready_queue.sort(key=lambda p: p.priority)
-            process = ready_queue.pop(0)
+            # Pick by priority (lower number = higher priority)
+            process = pop(ready_queue)[2]
+            burst = process.burst_time
             
-            process.start_time = self.current_time
-            self.gantt_chart.append((process.pid, self.current_time, 
-                                   self.current_time + process.burst_time))
+            process.start_time = now
+            emit(process.pid, now, now + burst)
             
-            self.current_time += process.burst_time
-            process.completion_time = self.current_time
+            now += burst
+            process.completion_time = now
+        
+        self.current_time = now
 
     def round_robin(self, time_quantum: int):
         """Round Robin - Preemptive scheduling with time slices"""
         ready_queue = deque()
-        remaining_processes = sorted(self.processes, key=lambda p: p.arrival_time)
+        arrivals = sorted(self.processes, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        i = 0
+        enqueue, dequeue = ready_queue.append, ready_queue.popleft
+        emit = self._emit
+        now = self.current_time
         
-        while remaining_processes or ready_queue:
+        while i < n or ready_queue:
             # Add newly arrived processes
-            while remaining_processes and remaining_processes[0].arrival_time <= self.current_time:
-                ready_queue.append(remaining_processes.pop(0))
+            while i < n and arrivals[i].arrival_time <= now:
+                enqueue(arrivals[i])
+                i += 1
             
             if not ready_queue:
-                self.current_time = remaining_processes[0].arrival_time
+                now = arrivals[i].arrival_time
                 continue
             
-            process = ready_queue.popleft()
-            time_slice = min(time_quantum, process.remaining_time)
+            process = dequeue()
+            if process.start_time is None:
+                process.start_time = now
+            remaining = process.remaining_time
+            time_slice = time_quantum if time_quantum < remaining else remaining
             
             # Execute for time quantum or until completion
-            self.gantt_chart.append((process.pid, self.current_time, 
-                                   self.current_time + time_slice))
+            emit(process.pid, now, now + time_slice)
             
-            process.remaining_time -= time_slice
-            self.current_time += time_slice
+            remaining -= time_slice
+            process.remaining_time = remaining
+            now += time_slice
             
             # Add back to queue if not finished
-            if process.remaining_time > 0:
-                ready_queue.append(process)
+            if remaining > 0:
+                enqueue(process)
             else:
-                process.completion_time = self.current_time
+                process.completion_time = now
+        
+        self.current_time = now
 
     def srtf(self):
         """Shortest Remaining Time First - Preemptive version of SJF"""
+        # Event driven: the only events are an arrival and the running job
+        # finishing, so a job runs uninterrupted until one of them happens.
+        # Min-heap of (remaining_time, seq, process) for waiting processes
         ready_queue = []
-        remaining_processes = sorted(self.processes, key=lambda p: p.arrival_time)
+        arrivals = sorted(self.processes, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        i = 0
+        seq = 0
+        push, pop, pushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+        emit = self._emit
+        now = self.current_time
+        running = None          # Heap entry of the process on the CPU
+        segment_start = now
         
-        while remaining_processes or ready_queue:
+        while i < n or ready_queue or running:
+            if running:
+                # Re-key the running process ahead of any new arrivals
+                running = (running[2].remaining_time, seq, running[2])
+                seq += 1
+            
             # Add newly arrived processes
-            while remaining_processes and remaining_processes[0].arrival_time <= self.current_time:
-                ready_queue.append(remaining_processes.pop(0))
+            while i < n and arrivals[i].arrival_time <= now:
+                p = arrivals[i]
+                push(ready_queue, (p.remaining_time, seq, p))
+                seq += 1
+                i += 1
             
-            if not ready_queue:
-                self.current_time = remaining_processes[0].arrival_time
+            if running:
+                # Keep running unless a shorter job is now waiting
+                chosen = pushpop(ready_queue, running)
+                if chosen is not running:
+                    emit(running[2].pid, segment_start, now)
+                    segment_start = now
+                    running = chosen
+            elif ready_queue:
+                running = pop(ready_queue)
+                segment_start = now
+            else:
+                now = arrivals[i].arrival_time
                 continue
             
-            # Choose process with shortest remaining time
-            ready_queue.sort(key=lambda p: p.remaining_time)
-            process = ready_queue.pop(0)
-            
-            # Find how long we can run this process
-            next_arrival = float('inf')
-            if remaining_processes:
-                next_arrival = remaining_processes[0].arrival_time
-            
-            run_time = min(process.remaining_time, 
-                          next_arrival - self.current_time if next_arrival != float('inf') else process.remaining_time)
-            
-            self.gantt_chart.append((process.pid, self.current_time, 
-                                   self.current_time + run_time))
+            process = running[2]
+            if process.start_time is None:
+                process.start_time = now
+            finish = now + process.remaining_time
             
-            process.remaining_time -= run_time
-            self.current_time += run_time
-            
-            if process.remaining_time > 0:
-                ready_queue.append(process)
+            if i < n and arrivals[i].arrival_time < finish:
+                # Next event is an arrival, run up to it
+                process.remaining_time = finish - arrivals[i].arrival_time
+                now = arrivals[i].arrival_time
             else:
-                process.completion_time = self.current_time
+                process.remaining_time = 0
+                now = finish
+                process.completion_time = now
+                emit(process.pid, segment_start, now)
+                running = None
+        
+        self.current_time = now
 
-    def get_metrics(self):
-        """Calculate and return the scheduling metrics"""
-        total_tat = 0
-        total_wt = 0
+    def get_metrics(self, verbose: bool = False):
+        """Calculate and return the scheduling metrics.
         
-        for process in self.processes:
+        All metrics come out of a single pass over the processes, ordered so
+        each one reuses what was already computed (WT from TAT). The result
+        is cached until the schedule changes; callers get their own copy.
+        """
+        key = (len(self.gantt_chart), self.current_time)
+        if self._metrics is not None and self._metrics[0] == key:
+            metrics = self._metrics[1]
+        else:
+            metrics = self._compute_metrics()
+            self._metrics = (key, metrics)
+        
+        if verbose:
+            for process, p_tat, p_wt, p_rt in zip(self.processes, metrics["tat"],
+                                                  metrics["wt"], metrics["rt"]):
+                print(f"Process {process.pid}:")
+                print(f"  Turnaround Time: {p_tat}")
+                print(f"  Waiting Time: {p_wt}")
+                print(f"  Response Time: {p_rt}")
+            
+            print(f"\nAverage Turnaround Time: {metrics['avg_tat']:.2f}")
+            print(f"Average Waiting Time: {metrics['avg_wt']:.2f}")
+            print(f"Average Response Time: {metrics['avg_rt']:.2f}")
+        
+        # Per-process values are tuples, so a shallow copy keeps the cache intact
+        return dict(metrics)
+
+    def _compute_metrics(self):
+        n = len(self.processes)
+        tat, wt, rt = [], [], []
+        busy = 0
+        first_arrival = None
+        last_completion = None
+        
+        for p in self.processes:
             # Turnaround Time = Completion Time - Arrival Time
-            tat = process.completion_time - process.arrival_time
+            p_tat = p.completion_time - p.arrival_time
+            tat.append(p_tat)
             # Waiting Time = Turnaround Time - Burst Time
-            wt = tat - process.burst_time
-            
-            total_tat += tat
-            total_wt += wt
+            wt.append(p_tat - p.burst_time)
+            # Response Time = First Start - Arrival Time
+            rt.append(p.start_time - p.arrival_time)
             
-            print(f"Process {process.pid}:")
-            print(f"  Turnaround Time: {tat}")
-            print(f"  Waiting Time: {wt}")
+            busy += p.burst_time
+            if first_arrival is None or p.arrival_time < first_arrival:
+                first_arrival = p.arrival_time
+            if last_completion is None or p.completion_time > last_completion:
+                last_completion = p.completion_time
         
-        avg_tat = total_tat / len(self.processes)
-        avg_wt = total_wt / len(self.processes)
-        
-        print(f"\nAverage Turnaround Time: {avg_tat:.2f}")
-        print(f"Average Waiting Time: {avg_wt:.2f}")
+        span = last_completion - first_arrival
+        return {
+            "tat": tuple(tat),
+            "wt": tuple(wt),
+            "rt": tuple(rt),
+            "avg_tat": sum(tat) / n,
+            "avg_wt": sum(wt) / n,
+            "avg_rt": sum(rt) / n,
+            "throughput": n / span if span else 0.0,
+            "cpu_utilization": busy / span if span else 0.0,
+        }
 
     def display_gantt_chart(self):
         """Display a simple ASCII Gantt chart"""
-        print("\nGantt Chart:")
-        print("-" * 50)
-        
-        for pid, start, end in self.gantt_chart:
-            print(f"|P{pid}({start}-{end})", end="")
-        print("|")
-        print("-" * 50)
+        rule = "-" * 50
+        # Build the whole chart first so it goes out in a single write
+        body = "".join(f"|P{pid}({start}-{end})" for pid, start, end in self.gantt_chart)
+        sys.stdout.write(f"\nGantt Chart:\n{rule}\n{body}|\n{rule}\n")
+
+def _make_reader():
+    """Return (read, interactive) for main's input.
+    
+    Piped input is read from stdin in one go and handed out token by token,
+    with prompts dropped; a terminal keeps the usual input() prompts.
+    """
+    if sys.stdin.isatty():
+        return input, True
+    
+    tokens = iter(sys.stdin.read().split())
+    
+    def read(prompt=""):
+        try:
+            return next(tokens)
+        except StopIteration:
+            raise EOFError from None
+    
+    return read, False
 
 def main():
+    read, interactive = _make_reader()
+    
     while True:
-        print("\nCPU Scheduling Simulator")
-        print("1. First Come First Serve (FCFS)")
-        print("2. Shortest Job First (SJF)")
-        print("3. Priority Scheduling")
-        print("4. Round Robin (RR)")
-        print("5. Shortest Remaining Time First (SRTF)")
-        print("6. Exit")
+        if interactive:
+            print("\nCPU Scheduling Simulator")
+            print("1. First Come First Serve (FCFS)")
+            print("2. Shortest Job First (SJF)")
+            print("3. Priority Scheduling")
+            print("4. Round Robin (RR)")
+            print("5. Shortest Remaining Time First (SRTF)")
+            print("6. Exit")
         
-        choice = input("Choose an algorithm (1-6): ")
+        try:
+            choice = read("Choose an algorithm (1-6): ")
+        except EOFError:
+            break
         
         if choice == '6':
             break
             
-        n = int(input("Enter number of processes: "))
+        n = int(read("Enter number of processes: "))
         processes = []
         
         for i in range(n):
-            print(f"\nProcess {i+1}:")
-            arrival = int(input("Arrival time: "))
-            burst = int(input("Burst time: "))
+            if interactive:
+                print(f"\nProcess {i+1}:")
+            arrival = int(read("Arrival time: "))
+            burst = int(read("Burst time: "))
             priority = None
             
             if choice == '3':  # Priority Scheduling
-                priority = int(input("Priority (lower number = higher priority): "))
+                priority = int(read("Priority (lower number = higher priority): "))
                 
             processes.append(Process(i+1, arrival, burst, priority))
             
-        scheduler = CPUScheduler(processes)
+        scheduler = CPUScheduler(processes, copy=False)
         
         if choice == '1':
             scheduler.fcfs()
@@ -238,13 +383,13 @@ def main():
         elif choice == '3':
             scheduler.priority_scheduling()
         elif choice == '4':
-            quantum = int(input("Enter time quantum: "))
+            quantum = int(read("Enter time quantum: "))
             scheduler.round_robin(quantum)
         elif choice == '5':
             scheduler.srtf()
             
         scheduler.display_gantt_chart()
-        scheduler.get_metrics()
+        scheduler.get_metrics(verbose=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file